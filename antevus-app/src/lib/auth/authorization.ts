@@ -276,6 +276,9 @@ export interface AuthorizationContext {
  * Authorization Service
  */
 export class AuthorizationService {
+  // Compiled regexes for matches_regex conditions, keyed by pattern source
+  private regexCache = new Map<string, RegExp>()
+
   /**
    * Check if user can perform action on resource
    */
@@ -476,13 +479,25 @@ export class AuthorizationService {
 
       case 'matches_regex':
         if (typeof expectedValue !== 'string') return false
-        return new RegExp(expectedValue).test(String(fieldValue))
+        return this.getRegex(expectedValue).test(String(fieldValue))
 
       default:
         return false
     }
   }
 
+  /**
+   * Get a compiled regex for a condition pattern, compiling it only once
+   */
+  private getRegex(pattern: string): RegExp {
+    let regex = this.regexCache.get(pattern)
+    if (!regex) {
+      regex = new RegExp(pattern)
+      this.regexCache.set(pattern, regex)
+    }
+    return regex
+  }
+
   /**
    * Log authorization decision for audit
    */